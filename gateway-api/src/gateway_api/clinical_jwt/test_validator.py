@@ -1,5 +1,7 @@
 """Unit tests for JWT validator."""
 
+from time import time
+
 import pytest
 
 from gateway_api.clinical_jwt import JWT
@@ -102,8 +104,6 @@ class TestValidateTimestamps:
 
     def test_issued_at_in_future_raises_error(self, valid_jwt: JWT) -> None:
         """Test that issued_at set in the future raises a validation error."""
-        from time import time
-
         future_iat = int(time()) + 3600  # 1 hour in the future
         jwt = JWT(
             issuer=valid_jwt.issuer,
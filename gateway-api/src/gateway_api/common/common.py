@@ -5,11 +5,17 @@ Shared lightweight types and helpers used across the gateway API.
 import re
 from dataclasses import dataclass
 from http import HTTPStatus
+from http.cookiejar import DefaultCookiePolicy
+
+from requests import Session
 
 # This project uses JSON request/response bodies as strings in the controller layer.
 # The alias is used to make intent clearer in function signatures.
 type json_str = str
 
+# Separators tolerated in NHS numbers, e.g. "943 476 5919" or "943-476-5919".
+_NHS_NUMBER_SEPARATORS_RE = re.compile(r"[\s-]")
+
 
 @dataclass
 class FlaskResponse:
@@ -40,7 +46,7 @@ def validate_nhs_number(value: str | int) -> bool:
     :returns: ``True`` if the number is a valid NHS number, otherwise ``False``.
     """
     str_value = str(value)  # Just in case they passed an integer
-    digits = re.sub(r"[\s-]", "", str_value or "")
+    digits = _NHS_NUMBER_SEPARATORS_RE.sub("", str_value or "")
 
     if len(digits) != 10:
         return False
@@ -67,3 +73,19 @@ def validate_nhs_number(value: str | int) -> bool:
 def get_http_text(status_code: int) -> str:
     status = HTTPStatus(status_code)
     return status.phrase
+
+
+def create_session() -> Session:
+    """
+    Create a :class:`requests.Session` for calls to upstream services.
+
+    A shared session keeps connections alive between requests, but it is also shared
+    between every inbound request the gateway serves. Cookies are therefore never
+    stored, so a ``Set-Cookie`` from an upstream response is not replayed on
+    requests made on behalf of other users or organisations.
+
+    :returns: A session whose cookie jar accepts no cookies.
+    """
+    session = Session()
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    return session
@@ -2,7 +2,11 @@
 Unit tests for :mod:`gateway_api.common.common`.
 """
 
+from collections.abc import Iterator
 from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+from typing import Any
 
 import pytest
 
@@ -63,3 +67,50 @@ def test_get_http_text() -> None:
     """
     for status in [200, 400, 500]:
         assert common.get_http_text(status) == HTTPStatus(status).phrase
+
+
+class _SetCookieHandler(BaseHTTPRequestHandler):
+    """
+    Records the ``Cookie`` header of each request and answers with a ``Set-Cookie``.
+    """
+
+    sent_cookies: list[str | None] = []
+
+    def do_GET(self) -> None:  # noqa: N802 - name required by BaseHTTPRequestHandler
+        self.sent_cookies.append(self.headers.get("Cookie"))
+        self.send_response(200)
+        self.send_header("Set-Cookie", "affinity=upstream-node-1; Path=/")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *_: Any) -> None:
+        """Keep the test output quiet."""
+
+
+@pytest.fixture
+def upstream() -> Iterator[str]:
+    """
+    Serve :class:`_SetCookieHandler` on a free local port and yield its base URL.
+    """
+    _SetCookieHandler.sent_cookies = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _SetCookieHandler)
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def test_create_session_does_not_replay_cookies(upstream: str) -> None:
+    """
+    A cookie set by one upstream response must not be sent on the next request.
+    """
+    session = common.create_session()
+
+    first = session.get(f"{upstream}/Patient/9000000009", timeout=5)
+    session.get(f"{upstream}/Patient/9000000017", timeout=5)
+
+    assert first.headers["Set-Cookie"] == "affinity=upstream-node-1; Path=/"
+    assert _SetCookieHandler.sent_cookies == [None, None]
+    assert len(session.cookies) == 0
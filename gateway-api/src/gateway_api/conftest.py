@@ -3,7 +3,7 @@
 import json
 import os
 from collections.abc import Mapping
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from types import TracebackType
 from typing import Any
 
@@ -45,16 +45,23 @@ class ScopedEnvVars:
         os.environ.update(self.original_env_vars)
 
 
-@dataclass
+@dataclass(slots=True)
 class FakeResponse:
     """
     Minimal substitute for :class:`requests.Response` used by tests.
+
+    The body is serialised once on construction, so ``_json`` should not be
+    mutated afterwards; build a new response instead.
     """
 
     status_code: int
     headers: dict[str, str] | CaseInsensitiveDict[str]
     _json: dict[str, Any]
     reason: str = ""
+    _content: bytes = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._content = json.dumps(self._json).encode("utf-8")
 
     def json(
         self,
@@ -70,7 +77,11 @@ class FakeResponse:
 
     @property
     def text(self) -> str:
-        return json.dumps(self._json)
+        return self._content.decode("utf-8")
+
+    @property
+    def content(self) -> bytes:
+        return self._content
 
 
 def create_mock_request(headers: dict[str, str], body: dict[str, Any]) -> Request:
@@ -21,11 +21,13 @@ malformed upstream data (or malformed test fixtures) and should be corrected at
 import logging
 import os
 import uuid
+from collections.abc import Callable
 
 import requests
 from fhir.r4 import Patient
 from pydantic import ValidationError
 
+from gateway_api.common.common import create_session
 from gateway_api.common.error import PdsRequestFailedError
 
 # TODO [GPCAPIM-359]: Once stub servers/containers made for PDS, SDS and provider
@@ -34,7 +36,9 @@ from gateway_api.common.error import PdsRequestFailedError
 STUB_PDS = os.environ["PDS_URL"].lower() == "stub"
 
 if not STUB_PDS:
-    from requests import get
+    # Shared across requests; see create_session for why it stores no cookies.
+    _session = create_session()
+    get = _session.get
 else:
     from stubs.pds.stub import PdsFhirApiStub
 
@@ -55,6 +59,9 @@ class PdsClient:
     This method returns a :class:`Patient` instance when a patient can be
     extracted, otherwise  raise `PdsRequestFailedError` with a reason for the failure.
 
+    Lookups are sent with ``http_get`` if given, otherwise with the module-level
+    ``get``: the shared session, or the PDS stub when ``PDS_URL`` is ``stub``.
+
     **Usage example**::
 
         pds = PdsClient(
@@ -74,11 +81,13 @@ class PdsClient:
         base_url: str,
         timeout: int = 10,
         ignore_dates: bool = False,
+        http_get: Callable[..., requests.Response] | None = None,
     ) -> None:
         self.auth_token = auth_token
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.ignore_dates = ignore_dates
+        self._http_get = http_get or get
 
         log_details = {
             "description": "Initialized PdsClient",
@@ -130,8 +139,9 @@ class PdsClient:
             "url": url,
         }
         _logger.info(log_details)
-        # This normally calls requests.get, but if PDS_URL is set it uses the stub.
-        response = get(
+        # Unless a transport was injected, this calls the shared session's get (or the
+        # stub if PDS_URL is set to "stub").
+        response = self._http_get(
             url,
             headers=headers,
             params={},
@@ -149,7 +159,9 @@ class PdsClient:
             raise PdsRequestFailedError(error_reason=err.response.reason) from err
 
         try:
-            patient = Patient.model_validate(response.json())
+            # Validate straight from the raw bytes so pydantic-core's parser builds
+            # the model in one pass, instead of json.loads then model_validate.
+            patient = Patient.model_validate_json(response.content)
         except ValidationError as err:
             first_error = err.errors()[0]
             raise PdsRequestFailedError(
@@ -2,8 +2,10 @@
 Unit tests for :mod:`gateway_api.pds_search`.
 """
 
+import re
 from typing import Any
-from uuid import UUID, uuid4
+from unittest.mock import Mock
+from uuid import uuid4
 
 import pytest
 from fhir.r4 import Patient
@@ -13,18 +15,42 @@ from gateway_api.common.error import PdsRequestFailedError
 from gateway_api.conftest import FakeResponse
 from gateway_api.pds.client import PdsClient
 
+_UUID4_RE = re.compile(
+    r"[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}"
+)
 
-def test_search_patient_by_nhs_number_happy_path(
-    auth_token: str,
+_NOT_FOUND_RESPONSE = FakeResponse(
+    status_code=404,
+    headers={},
+    _json={"resourceType": "OperationOutcome", "issue": []},
+    reason="Not Found",
+)
+
+
+@pytest.fixture
+def mocked_get(
     mocker: MockerFixture,
     happy_path_pds_response_body: dict[str, Any],
-) -> None:
-    happy_path_response = FakeResponse(
-        status_code=200, headers={}, _json=happy_path_pds_response_body
+) -> Mock:
+    """
+    Injected PDS transport returning the happy path response by default.
+
+    Tests needing a different response set ``mocked_get.return_value``.
+    """
+    get: Mock = mocker.Mock(
+        return_value=FakeResponse(
+            status_code=200, headers={}, _json=happy_path_pds_response_body
+        )
     )
-    mocker.patch("gateway_api.pds.client.get", return_value=happy_path_response)
+    return get
+
 
-    client = PdsClient(auth_token, base_url="https://test.com")
+@pytest.fixture
+def client(auth_token: str, mocked_get: Mock) -> PdsClient:
+    return PdsClient(auth_token, base_url="https://test.com", http_get=mocked_get)
+
+
+def test_search_patient_by_nhs_number_happy_path(client: PdsClient) -> None:
     patient = client.search_patient_by_nhs_number("9999999999")
 
     assert isinstance(patient, Patient)
@@ -33,18 +59,16 @@ def test_search_patient_by_nhs_number_happy_path(
 
 
 def test_search_patient_by_nhs_number_has_no_gp_returns_gp_ods_code_none(
-    auth_token: str,
-    mocker: MockerFixture,
+    client: PdsClient,
+    mocked_get: Mock,
     happy_path_pds_response_body: dict[str, Any],
 ) -> None:
     gp_less_response_body = happy_path_pds_response_body.copy()
     del gp_less_response_body["generalPractitioner"]
-    gp_less_response = FakeResponse(
+    mocked_get.return_value = FakeResponse(
         status_code=200, headers={}, _json=gp_less_response_body
     )
-    mocker.patch("gateway_api.pds.client.get", return_value=gp_less_response)
 
-    client = PdsClient(auth_token, base_url="https://test.com")
     patient = client.search_patient_by_nhs_number("9999999999")
 
     assert isinstance(patient, Patient)
@@ -54,20 +78,12 @@ def test_search_patient_by_nhs_number_has_no_gp_returns_gp_ods_code_none(
 
 def test_search_patient_by_nhs_number_sends_expected_headers(
     auth_token: str,
-    mocker: MockerFixture,
-    happy_path_pds_response_body: dict[str, Any],
+    client: PdsClient,
+    mocked_get: Mock,
 ) -> None:
-    happy_path_response = FakeResponse(
-        status_code=200, headers={}, _json=happy_path_pds_response_body
-    )
-    mocked_get = mocker.patch(
-        "gateway_api.pds.client.get", return_value=happy_path_response
-    )
-
     request_id = str(uuid4())
     correlation_id = "corr-123"
 
-    client = PdsClient(auth_token, base_url="https://test.com")
     _ = client.search_patient_by_nhs_number(
         "9000000009",
         request_id=request_id,
@@ -85,83 +101,71 @@ def test_search_patient_by_nhs_number_sends_expected_headers(
 
 
 def test_search_patient_by_nhs_number_generates_request_id(
-    auth_token: str,
-    mocker: MockerFixture,
-    happy_path_pds_response_body: dict[str, Any],
+    client: PdsClient,
+    mocked_get: Mock,
 ) -> None:
-    happy_path_response = FakeResponse(
-        status_code=200, headers={}, _json=happy_path_pds_response_body
-    )
-    mocked_get = mocker.patch(
-        "gateway_api.pds.client.get", return_value=happy_path_response
-    )
-
-    client = PdsClient(auth_token, base_url="https://test.com")
-
     _ = client.search_patient_by_nhs_number("9000000009")
 
-    try:
-        _ = UUID(mocked_get.call_args.kwargs["headers"]["X-Request-ID"], version=4)
-    except ValueError:
-        pytest.fail("X-Request-ID is not a valid UUID4")
+    request_id = mocked_get.call_args.kwargs["headers"]["X-Request-ID"]
+    assert _UUID4_RE.fullmatch(request_id), "X-Request-ID is not a valid UUID4"
 
 
 def test_search_patient_by_nhs_number_not_found_raises_error(
-    auth_token: str,
-    mocker: MockerFixture,
+    client: PdsClient,
+    mocked_get: Mock,
 ) -> None:
-    not_found_response = FakeResponse(
-        status_code=404,
-        headers={},
-        _json={"resourceType": "OperationOutcome", "issue": []},
-        reason="Not Found",
-    )
-    mocker.patch("gateway_api.pds.client.get", return_value=not_found_response)
-    pds = PdsClient(auth_token, base_url="https://test.com")
+    mocked_get.return_value = _NOT_FOUND_RESPONSE
 
     with pytest.raises(
         PdsRequestFailedError, match="PDS FHIR API request failed: Not Found"
     ):
-        pds.search_patient_by_nhs_number("9900000001")
-
-
-def test_search_patient_by_nhs_number_missing_nhs_number_raises_error(
-    auth_token: str,
-    mocker: MockerFixture,
+        client.search_patient_by_nhs_number("9900000001")
+
+
+@pytest.mark.parametrize(
+    ("overrides", "expected_fragments"),
+    [
+        pytest.param(
+            {"identifier": []},
+            ("'identifier'", "too_short"),
+            id="no_nhs_number",
+        ),
+        pytest.param(
+            {"resourceType": "OperationOutcome"},
+            ("'resourceType'", "does not match expected resource type"),
+            id="wrong_resource_type",
+        ),
+        pytest.param(
+            {"generalPractitioner": [{}]},
+            ("'generalPractitioner'", "missing"),
+            id="gp_without_identifier",
+        ),
+    ],
+)
+def test_search_patient_by_nhs_number_invalid_body_raises_error(
+    client: PdsClient,
+    mocked_get: Mock,
     happy_path_pds_response_body: dict[str, Any],
+    overrides: dict[str, Any],
+    expected_fragments: tuple[str, ...],
 ) -> None:
-    response_body_missing_nhs_number = happy_path_pds_response_body.copy()
-    response_body_missing_nhs_number["identifier"] = []
-
-    response = FakeResponse(
+    mocked_get.return_value = FakeResponse(
         status_code=200,
         headers={},
-        _json=response_body_missing_nhs_number,
+        _json={**happy_path_pds_response_body, **overrides},
     )
-    mocker.patch("gateway_api.pds.client.get", return_value=response)
-
-    client = PdsClient(auth_token, base_url="https://test.com")
 
     with pytest.raises(PdsRequestFailedError) as error:
         client.search_patient_by_nhs_number("9999999999")
 
-    assert "'identifier'" in str(error.value)
-    assert "too_short" in str(error.value)
+    for fragment in expected_fragments:
+        assert fragment in str(error.value)
 
 
-def test_search_patient_respects_url(
-    auth_token: str,
-    mocker: MockerFixture,
-    happy_path_pds_response_body: dict[str, Any],
-) -> None:
-    happy_path_response = FakeResponse(
-        status_code=200, headers={}, _json=happy_path_pds_response_body
+def test_search_patient_respects_url(auth_token: str, mocked_get: Mock) -> None:
+    client = PdsClient(
+        auth_token, base_url="https://a.different.url/base", http_get=mocked_get
     )
-    mocked_get = mocker.patch(
-        "gateway_api.pds.client.get", return_value=happy_path_response
-    )
-
-    client = PdsClient(auth_token, base_url="https://a.different.url/base")
     _ = client.search_patient_by_nhs_number("9000000009")
 
     actual_url = mocked_get.call_args.args[0]
@@ -24,12 +24,13 @@ Usage:
 
 import logging
 import os
+from collections.abc import Callable
 from urllib.parse import urljoin
 
 from requests import HTTPError, Response
 
 from gateway_api.clinical_jwt import JWT, JWTValidator
-from gateway_api.common.common import get_http_text
+from gateway_api.common.common import create_session, get_http_text
 from gateway_api.common.error import JWTValidationError, ProviderRequestFailedError
 from gateway_api.get_structured_record import ACCESS_RECORD_STRUCTURED_INTERACTION_ID
 
@@ -38,7 +39,9 @@ from gateway_api.get_structured_record import ACCESS_RECORD_STRUCTURED_INTERACTI
 #       use the stub client
 STUB_PROVIDER = os.environ["PROVIDER_URL"].lower() == "stub"
 if not STUB_PROVIDER:
-    from requests import post
+    # Shared across requests; see create_session for why it stores no cookies.
+    _session = create_session()
+    post = _session.post
 else:
     from stubs.provider.stub import GpProviderStub
 
@@ -66,6 +69,7 @@ class GpProviderClient:
         token (JWT): JWT object for authentication with the provider API.
         endpoint_path (str): The endpoint path for the operation
             (default: "Patient/$gpc.getstructuredrecord").
+        http_post (Callable): Optional transport used instead of the module `post`.
 
     Methods:
         access_structured_record(trace_id: str, body: str) -> Response:
@@ -79,12 +83,14 @@ class GpProviderClient:
         consumer_asid: str,
         token: JWT,
         endpoint_path: str = ARS_ENDPOINT_PATH,
+        http_post: Callable[..., Response] | None = None,
     ) -> None:
         self.provider_endpoint = provider_endpoint
         self.provider_asid = provider_asid
         self.consumer_asid = consumer_asid
         self.token = token
         self.endpoint_path = endpoint_path
+        self._http_post = http_post or post
 
         log_details = {
             "description": "Initialized GpProviderClient",
@@ -135,7 +141,7 @@ class GpProviderClient:
         }
         _logger.info(log_details)
 
-        response = post(
+        response = self._http_post(
             url,
             headers=headers,
             data=body,
@@ -7,15 +7,16 @@ for interacting with the GPProvider FHIR API.
 """
 
 import json
+from dataclasses import replace
 from typing import Any
+from unittest.mock import patch
 
 import pytest
 from requests import Response
-from requests.structures import CaseInsensitiveDict
 from stubs.provider.stub import GpProviderStub
 
 from gateway_api.clinical_jwt import JWT
-from gateway_api.common.error import ProviderRequestFailedError
+from gateway_api.common.error import JWTValidationError, ProviderRequestFailedError
 from gateway_api.provider import GpProviderClient, client
 
 
@@ -39,13 +40,13 @@ def mock_request_post(
 
     def _fake_post(
         url: str,
-        headers: CaseInsensitiveDict[str],
+        headers: dict[str, str],
         data: str,
         timeout: int,  # NOQA ARG001 (unused in stub)
     ) -> Response:
         """A fake requests.post implementation."""
 
-        capture["headers"] = dict(headers)
+        capture["headers"] = headers
         capture["data"] = data
         capture["url"] = url
 
@@ -53,7 +54,7 @@ def mock_request_post(
         return stub.access_record_structured(
             trace_id=headers.get("Ssp-TraceID", "dummy-trace-id"),
             body=data,
-            headers=dict(headers),
+            headers=headers,
         )
 
     monkeypatch.setattr(client, "post", _fake_post)
@@ -281,6 +282,87 @@ def test_gpprovider_client_includes_authorization_header_with_bearer_token(
     assert result.status_code == 200
 
 
+def test_gpprovider_client_authorization_header_follows_replaced_token(
+    mock_request_post: dict[str, Any],
+    valid_simple_request_payload: dict[str, Any],
+    valid_jwt: JWT,
+) -> None:
+    """
+    Test that assigning a new token to the client changes the Authorization
+    header sent on subsequent requests.
+    """
+    client = GpProviderClient(
+        provider_endpoint="https://test.com",
+        provider_asid="200000001154",
+        consumer_asid="200000001152",
+        token=valid_jwt,
+    )
+    new_jwt = replace(
+        valid_jwt,
+        issued_at=valid_jwt.issued_at - 1,
+        expiration=valid_jwt.expiration - 1,
+    )
+
+    client.token = new_jwt
+    client.access_structured_record(
+        "test-trace-id", json.dumps(valid_simple_request_payload)
+    )
+
+    assert mock_request_post["headers"]["Authorization"] == f"Bearer {new_jwt}"
+    assert str(new_jwt) != str(valid_jwt)
+
+
+def test_gpprovider_client_ssp_headers_follow_reassigned_asids(
+    mock_request_post: dict[str, Any],
+    valid_simple_request_payload: dict[str, Any],
+    valid_jwt: JWT,
+) -> None:
+    """
+    Test that reassigning the provider and consumer ASIDs changes the Ssp-To and
+    Ssp-From headers sent on subsequent requests.
+    """
+    client = GpProviderClient(
+        provider_endpoint="https://test.com",
+        provider_asid="200000001154",
+        consumer_asid="200000001152",
+        token=valid_jwt,
+    )
+
+    client.provider_asid = "200000009999"
+    client.consumer_asid = "200000008888"
+    client.access_structured_record(
+        "test-trace-id", json.dumps(valid_simple_request_payload)
+    )
+
+    assert mock_request_post["headers"]["Ssp-To"] == "200000009999"
+    assert mock_request_post["headers"]["Ssp-From"] == "200000008888"
+
+
+def test_gpprovider_client_url_follows_reassigned_endpoint(
+    mock_request_post: dict[str, Any],
+    valid_simple_request_payload: dict[str, Any],
+    valid_jwt: JWT,
+) -> None:
+    """
+    Test that reassigning the provider endpoint and endpoint path changes the URL
+    used for subsequent requests.
+    """
+    client = GpProviderClient(
+        provider_endpoint="https://test.com",
+        provider_asid="200000001154",
+        consumer_asid="200000001152",
+        token=valid_jwt,
+    )
+
+    client.provider_endpoint = "https://other.test.com/fhir"
+    client.endpoint_path = "Patient/$custom"
+    client.access_structured_record(
+        "test-trace-id", json.dumps(valid_simple_request_payload)
+    )
+
+    assert mock_request_post["url"] == "https://other.test.com/fhir/Patient/$custom"
+
+
 @pytest.mark.usefixtures("mock_request_post")
 def test_access_structured_record_debug_error_when_cdg_debug_set(
     valid_simple_request_payload: dict[str, Any],
@@ -325,8 +407,6 @@ def test_gpprovider_client_raises_on_invalid_jwt_at_instantiation() -> None:
     Test that GpProviderClient raises JWTValidationError when constructed with
     an invalid JWT, because the token setter calls JWTValidator.validate().
     """
-    from gateway_api.common.error import JWTValidationError
-
     invalid_jwt = JWT(
         issuer="",  # missing issuer
         subject="",  # missing subject
@@ -357,8 +437,6 @@ def test_gpprovider_client_raises_provider_error_when_jwt_expired_at_request_tim
 
     This simulates the JWT expiring between client construction and the request.
     """
-    from unittest.mock import patch
-
     client = GpProviderClient(
         provider_endpoint="https://test.com",
         provider_asid="200000001154",
@@ -375,3 +453,29 @@ def test_gpprovider_client_raises_provider_error_when_jwt_expired_at_request_tim
         client.access_structured_record(
             "test-trace-id", json.dumps(valid_simple_request_payload)
         )
+
+
+def test_gpprovider_client_uses_injected_http_post(
+    stub: GpProviderStub,
+    valid_simple_request_payload: dict[str, Any],
+    valid_jwt: JWT,
+) -> None:
+    """
+    Test that a transport passed as `http_post` is used instead of the
+    module-level `post`, so no patching is needed.
+    """
+    request_body = json.dumps(valid_simple_request_payload)
+    client = GpProviderClient(
+        provider_endpoint="https://test.com",
+        provider_asid="200000001154",
+        consumer_asid="200000001152",
+        token=valid_jwt,
+        http_post=stub.post,
+    )
+
+    result = client.access_structured_record("some_uuid_value", request_body)
+
+    assert result.status_code == 200
+    assert stub.post_url == "https://test.com/Patient/$gpc.getstructuredrecord"
+    assert stub.post_data == request_body
+    assert stub.post_headers["Ssp-TraceID"] == "some_uuid_value"
@@ -11,7 +11,8 @@ from __future__ import annotations
 import logging
 import os
 from enum import StrEnum
-from typing import Any
+from functools import cache
+from typing import TYPE_CHECKING, Any
 
 from fhir import Resource
 from fhir.constants import FHIRSystem
@@ -27,6 +28,9 @@ from gateway_api.get_structured_record import (
 )
 from gateway_api.sds.search_results import SdsSearchResults
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 
 def get(
     url: str,
@@ -38,9 +42,14 @@ def get(
     if not STUB_SDS:
         return external_sds_get(url, headers=headers, params=params, timeout=timeout)
     else:
-        return SdsFhirApiStub().get(
-            url, headers=headers, params=params, timeout=timeout
-        )
+        return _sds_stub().get(url, headers=headers, params=params, timeout=timeout)
+
+
+@cache
+def _sds_stub() -> SdsFhirApiStub:
+    # Shared like the PDS and provider stubs, so the default devices and endpoints
+    # are seeded once rather than on every lookup.
+    return SdsFhirApiStub()
 
 
 _logger = logging.getLogger(__name__)
@@ -67,7 +76,8 @@ class SdsClient:
     **Stubbing**:
 
     For testing, set the environment variable ``$SDS_URL`` to use the
-    :class:`SdsFhirApiStub` instead of making real HTTP requests.
+    :class:`SdsFhirApiStub` instead of making real HTTP requests, or pass a
+    transport as ``http_get`` to use it in place of the module-level :func:`get`.
 
     **Usage example**::
 
@@ -92,10 +102,12 @@ class SdsClient:
         api_key: str,
         timeout: int = 10,
         service_interaction_id: str | None = None,
+        http_get: Callable[..., Response] | None = None,
     ) -> None:
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.api_key = api_key
+        self._http_get = http_get or get
 
         if service_interaction_id is not None:
             self.service_interaction_id = service_interaction_id
@@ -202,7 +214,7 @@ class SdsClient:
             "params": params,
         }
         _logger.info(log_details)
-        response = get(
+        response = self._http_get(
             url,
             headers=headers,
             params=params,
@@ -219,7 +231,7 @@ class SdsClient:
         except HTTPError as e:
             raise SdsRequestFailedError(error_reason=str(e)) from e
 
-        bundle = Bundle.model_validate(response.json())
+        bundle = Bundle.model_validate_json(response.content)
         return bundle
 
     @staticmethod
@@ -2,12 +2,15 @@
 Unit tests for :mod:`gateway_api.sds_search`.
 """
 
+from collections.abc import Callable, Iterator
+from typing import Any
 from unittest.mock import Mock, patch
 
 import pytest
 from fhir.constants import FHIRSystem
 from fhir.r4.resources.bundle import Bundle
 from pytest_mock import MockerFixture
+from requests import Response
 from stubs.sds.stub import SdsFhirApiStub
 
 from gateway_api.common.error import SdsRequestFailedError
@@ -17,18 +20,15 @@ from gateway_api.get_structured_record import (
     SDS_SANDBOX_INTERACTION_ID,
 )
 from gateway_api.sds import SdsClient, SdsSearchResults, get
+from gateway_api.sds.client import _sds_stub
 
 
 @pytest.fixture
-def stub(monkeypatch: pytest.MonkeyPatch) -> SdsFhirApiStub:
-    stub = SdsFhirApiStub()
-    monkeypatch.setattr(
-        "gateway_api.sds.client.get",
-        lambda *args, **kwargs: stub.get(*args, **kwargs),  # NOQA ARG005 (maintain signature)
-    )
-    monkeypatch.setattr("requests.get", stub.get)
-
-    return stub
+def stub() -> SdsFhirApiStub:
+    """
+    Fresh SDS stub per test. Pass ``http_get=stub.get`` to route a client to it.
+    """
+    return SdsFhirApiStub()
 
 
 def test_sds_client_get_org_details_success(stub: SdsFhirApiStub) -> None:
@@ -37,7 +37,9 @@ def test_sds_client_get_org_details_success(stub: SdsFhirApiStub) -> None:
 
     :param stub: SDS stub fixture.
     """
-    client = SdsClient(base_url="https://test.com", api_key="example_api_key")
+    client = SdsClient(
+        base_url="https://test.com", api_key="example_api_key", http_get=stub.get
+    )
 
     result = client.get_org_details(ods_code="PROVIDER")
 
@@ -106,7 +108,9 @@ def test_sds_client_get_org_details_with_endpoint(stub: SdsFhirApiStub) -> None:
         },
     )
 
-    client = SdsClient(base_url="https://test.com", api_key="example_api_key")
+    client = SdsClient(
+        base_url="https://test.com", api_key="example_api_key", http_get=stub.get
+    )
     result = client.get_org_details(ods_code="TESTORG")
 
     assert result is not None
@@ -114,38 +118,61 @@ def test_sds_client_get_org_details_with_endpoint(stub: SdsFhirApiStub) -> None:
     assert result.endpoint == "https://testorg.example.com/fhir"
 
 
-def test_sds_client_sends_correct_headers(stub: SdsFhirApiStub) -> None:
-    """
-    Test that SdsClient sends X-Correlation-Id and apikey headers when provided.
-
-    :param stub: SDS stub fixture.
-    :param mock_requests_get: Capture fixture for request details.
-    """
-    client = SdsClient(base_url="https://test.com", api_key="example_api_key")
-
-    correlation_id = "test-correlation-123"
-    client.get_org_details(ods_code="PROVIDER", correlation_id=correlation_id)
-
-    # Check that the headers were
-    assert stub.get_headers["X-Correlation-Id"] == correlation_id
-    assert stub.get_headers["apikey"] == "example_api_key"
-
-
-def test_sds_client_timeout_parameter(stub: SdsFhirApiStub) -> None:
+@pytest.mark.parametrize(
+    ("client_kwargs", "call_kwargs", "captured", "expected"),
+    [
+        pytest.param(
+            {},
+            {"correlation_id": "test-correlation-123"},
+            lambda stub: stub.get_headers["X-Correlation-Id"],
+            "test-correlation-123",
+            id="correlation_id_header",
+        ),
+        pytest.param(
+            {},
+            {},
+            lambda stub: stub.get_headers["apikey"],
+            "example_api_key",
+            id="apikey_header",
+        ),
+        pytest.param(
+            {"timeout": 30},
+            {"timeout": 60},
+            lambda stub: stub.get_timeout,
+            60,
+            id="call_timeout_overrides_client",
+        ),
+        pytest.param(
+            {"timeout": 30},
+            {},
+            lambda stub: stub.get_timeout,
+            30,
+            id="client_timeout_by_default",
+        ),
+    ],
+)
+def test_sds_client_passes_request_details(
+    stub: SdsFhirApiStub,
+    client_kwargs: dict[str, Any],
+    call_kwargs: dict[str, Any],
+    captured: Callable[[SdsFhirApiStub], object],
+    expected: object,
+) -> None:
     """
-    Test that SdsClient passes timeout parameter to requests.
+    Test that SdsClient passes headers and timeout through to the request.
 
     :param stub: SDS stub fixture.
-    :param mock_requests_get: Capture fixture for request details.
     """
     client = SdsClient(
-        base_url="https://test.com", api_key="example_api_key", timeout=30
+        base_url="https://test.com",
+        api_key="example_api_key",
+        http_get=stub.get,
+        **client_kwargs,
     )
 
-    client.get_org_details(ods_code="PROVIDER", timeout=60)
+    client.get_org_details(ods_code="PROVIDER", **call_kwargs)
 
-    # Check that the custom timeout was passed
-    assert stub.get_timeout == 60
+    assert captured(stub) == expected
 
 
 def test_sds_client_custom_service_interaction_id(stub: SdsFhirApiStub) -> None:
@@ -183,6 +210,7 @@ def test_sds_client_custom_service_interaction_id(stub: SdsFhirApiStub) -> None:
         base_url="https://test.com",
         service_interaction_id=custom_interaction,
         api_key="example_api_key",
+        http_get=stub.get,
     )
 
     result = client.get_org_details(ods_code="CUSTOMINT", get_endpoint=False)
@@ -205,7 +233,9 @@ def test_sds_client_builds_correct_device_query_params(stub: SdsFhirApiStub) ->
     :param stub: SDS stub fixture.
     :param mock_requests_get: Capture fixture for request details.
     """
-    client = SdsClient(base_url="https://test.com", api_key="example_api_key")
+    client = SdsClient(
+        base_url="https://test.com", api_key="example_api_key", http_get=stub.get
+    )
 
     client.get_org_details(ods_code="PROVIDER")
 
@@ -257,6 +287,7 @@ def test_sds_client_uses_sandbox_interaction_id_for_sandbox_url(
     client = SdsClient(
         base_url="https://sandbox.api.service.nhs.uk/spine-directory/FHIR/R4",
         api_key="example_api_key",
+        http_get=stub.get,
     )
     result = client.get_org_details(ods_code="SANDBOX_ORG", get_endpoint=False)
 
@@ -277,131 +308,123 @@ def test_sds_client_uses_sandbox_interaction_id_for_sandbox_url(
 
 
 def test_sds_client_raises_sds_request_failed_error_on_http_error(
-    monkeypatch: pytest.MonkeyPatch,
+    stub: SdsFhirApiStub,
 ) -> None:
     """
     Test that SdsClient raises SdsRequestFailedError when SDS returns
     a non-2xx response.
 
-    :param monkeypatch: Pytest monkeypatch fixture.
+    :param stub: SDS stub fixture.
     """
-    stub = SdsFhirApiStub()
 
     def get_without_apikey(
         url: str,
         headers: dict[str, str],
         params: dict[str, str],
         timeout: int = 10,
-    ) -> object:
+    ) -> Response:
         # Strip the apikey header so the stub returns a 400
         headers_without_key = {k: v for k, v in headers.items() if k != "apikey"}
         return stub.get(
             url=url, headers=headers_without_key, params=params, timeout=timeout
         )
 
-    monkeypatch.setattr("gateway_api.sds.client.get", get_without_apikey)
-
-    client = SdsClient(base_url="https://test.com", api_key="example_api_key")
+    client = SdsClient(
+        base_url="https://test.com",
+        api_key="example_api_key",
+        http_get=get_without_apikey,
+    )
 
     with pytest.raises(SdsRequestFailedError, match="SDS FHIR API request failed"):
         client.get_org_details(ods_code="PROVIDER")
 
 
-def test_sds_client_endpoint_entry_without_address_returns_none(
+@pytest.mark.parametrize(
+    ("ods_code", "device_asid", "endpoint", "expected"),
+    [
+        pytest.param(
+            "NOADDR",
+            "111111111111",
+            {
+                "resourceType": "Endpoint",
+                "id": "noaddr-endpoint",
+                "status": "active",
+                # no "address" field
+                "identifier": [
+                    {"system": FHIRSystem.NHS_SPINE_ASID, "value": "111111111111"}
+                ],
+            },
+            SdsSearchResults(asid="111111111111", endpoint=None),
+            id="endpoint_without_address",
+        ),
+        pytest.param(
+            # "UNKNOWN_ORG" has no seeded devices, so the Device bundle is empty
+            "UNKNOWN_ORG",
+            None,
+            None,
+            SdsSearchResults(asid=None, endpoint=None),
+            id="empty_device_bundle",
+        ),
+        pytest.param(
+            # A device but deliberately no endpoint, so the Endpoint bundle is empty
+            "NOENDPOINT",
+            "222222222222",
+            None,
+            SdsSearchResults(asid="222222222222", endpoint=None),
+            id="empty_endpoint_bundle",
+        ),
+    ],
+)
+def test_sds_client_missing_sds_data_returns_none_fields(
     stub: SdsFhirApiStub,
+    ods_code: str,
+    device_asid: str | None,
+    endpoint: dict[str, Any] | None,
+    expected: SdsSearchResults,
 ) -> None:
     """
-    Test that get_org_details returns endpoint=None when the Endpoint resource
-    has no address field.
-
-    :param stub: SDS stub fixture.
-    """
-    stub.upsert_device(
-        organization_ods="NOADDR",
-        service_interaction_id=ACCESS_RECORD_STRUCTURED_INTERACTION_ID,
-        device={
-            "resourceType": "Device",
-            "id": "noaddr-device",
-            "identifier": [
-                {"system": FHIRSystem.NHS_SPINE_ASID, "value": "111111111111"},
-            ],
-        },
-    )
-    stub.upsert_endpoint(
-        organization_ods="NOADDR",
-        service_interaction_id=ACCESS_RECORD_STRUCTURED_INTERACTION_ID,
-        endpoint={
-            "resourceType": "Endpoint",
-            "id": "noaddr-endpoint",
-            "status": "active",
-            # no "address" field
-            "identifier": [
-                {"system": FHIRSystem.NHS_SPINE_ASID, "value": "111111111111"}
-            ],
-        },
-    )
-
-    client = SdsClient(base_url="https://test.com", api_key="example_api_key")
-    result = client.get_org_details(ods_code="NOADDR")
-
-    assert result.asid == "111111111111"
-    assert result.endpoint is None
-
-
-@pytest.mark.usefixtures("stub")
-def test_sds_client_empty_device_bundle_returns_none_asid() -> None:
-    """
-    Test that get_org_details returns asid=None when the Device bundle has no
-    entries for the given ODS code, exercising the empty-entries branch in
-    _extract_first_entry.
+    Test that get_org_details returns ``None`` for the asid or endpoint when SDS
+    has no usable Device or Endpoint for the organisation.
 
     :param stub: SDS stub fixture.
     """
-    client = SdsClient(base_url="https://test.com", api_key="example_api_key")
-    # "UNKNOWN_ORG" has no seeded devices, so the bundle entry list will be empty
-    result = client.get_org_details(ods_code="UNKNOWN_ORG", get_endpoint=False)
-
-    assert result.asid is None
-
-
-def test_sds_client_no_endpoint_bundle_entries_returns_none_endpoint(
-    stub: SdsFhirApiStub,
-) -> None:
-    """
-    Test that get_org_details returns endpoint=None when the Endpoint bundle has
-    no entries, exercising the else branch after _extract_first_entry returns {}.
+    if device_asid is not None:
+        stub.upsert_device(
+            organization_ods=ods_code,
+            service_interaction_id=ACCESS_RECORD_STRUCTURED_INTERACTION_ID,
+            device={
+                "resourceType": "Device",
+                "id": f"{ods_code.lower()}-device",
+                "identifier": [
+                    {"system": FHIRSystem.NHS_SPINE_ASID, "value": device_asid},
+                ],
+            },
+        )
+    if endpoint is not None:
+        stub.upsert_endpoint(
+            organization_ods=ods_code,
+            service_interaction_id=ACCESS_RECORD_STRUCTURED_INTERACTION_ID,
+            endpoint=endpoint,
+        )
 
-    :param stub: SDS stub fixture.
-    """
-    stub.upsert_device(
-        organization_ods="NOENDPOINT",
-        service_interaction_id=ACCESS_RECORD_STRUCTURED_INTERACTION_ID,
-        device={
-            "resourceType": "Device",
-            "id": "noendpoint-device",
-            "identifier": [
-                {"system": FHIRSystem.NHS_SPINE_ASID, "value": "222222222222"},
-            ],
-        },
+    client = SdsClient(
+        base_url="https://test.com", api_key="example_api_key", http_get=stub.get
     )
-    # Deliberately do not seed any endpoint for NOENDPOINT
+    result = client.get_org_details(ods_code=ods_code)
 
-    client = SdsClient(base_url="https://test.com", api_key="example_api_key")
-    result = client.get_org_details(ods_code="NOENDPOINT")
-
-    assert result.asid == "222222222222"
-    assert result.endpoint is None
+    assert result == expected
 
 
 def test_sds_client_respects_url(mocker: MockerFixture) -> None:
     empty_bundle = Bundle.empty("searchset").model_dump()
-    mocked_get = mocker.patch(
-        "gateway_api.sds.client.get",
+    mocked_get = mocker.Mock(
         return_value=FakeResponse(status_code=200, headers={}, _json=empty_bundle),
     )
 
     client = SdsClient(
-        base_url="https://a.different.url/base", api_key="example_api_key"
+        base_url="https://a.different.url/base",
+        api_key="example_api_key",
+        http_get=mocked_get,
     )
     _ = client.get_org_details(ods_code="A12345", get_endpoint=False)
 
@@ -411,7 +434,7 @@ def test_sds_client_respects_url(mocker: MockerFixture) -> None:
     assert actual_headers["apikey"] == "example_api_key"
 
 
-@patch("gateway_api.sds.client.SdsFhirApiStub")
+@patch("gateway_api.sds.client._sds_stub")
 @patch("gateway_api.sds.client.external_sds_get")
 def test_get_with_stub(mock_external_get: Mock, mock_stub: Mock) -> None:
     with ScopedEnvVars({"SDS_URL": "stub"}):
@@ -420,10 +443,32 @@ def test_get_with_stub(mock_external_get: Mock, mock_stub: Mock) -> None:
         assert not mock_external_get.called
 
 
-@patch("gateway_api.sds.client.SdsFhirApiStub")
+@patch("gateway_api.sds.client._sds_stub")
 @patch("gateway_api.sds.client.external_sds_get")
 def test_get_without_stub(mock_external_get: Mock, mock_stub: Mock) -> None:
     with ScopedEnvVars({"SDS_URL": "https://www.example.com/"}):
         get("https://example.com/", headers={}, params={}, timeout=10)
         assert mock_external_get.called
         assert not mock_stub.return_value.get.called
+
+
+@pytest.fixture
+def cleared_sds_stub_cache() -> Iterator[None]:
+    """
+    Clear the shared SDS stub before and after a test, so a patched stub class is
+    used and not left behind for later tests.
+    """
+    _sds_stub.cache_clear()
+    yield
+    _sds_stub.cache_clear()
+
+
+@pytest.mark.usefixtures("cleared_sds_stub_cache")
+@patch("gateway_api.sds.client.SdsFhirApiStub")
+def test_get_with_stub_reuses_one_stub_instance(mock_stub_class: Mock) -> None:
+    with ScopedEnvVars({"SDS_URL": "stub"}):
+        get("https://example.com/Device", headers={}, params={}, timeout=10)
+        get("https://example.com/Endpoint", headers={}, params={}, timeout=10)
+
+    mock_stub_class.assert_called_once_with()
+    assert mock_stub_class.return_value.get.call_count == 2
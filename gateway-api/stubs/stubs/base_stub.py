@@ -34,13 +34,29 @@ class StubBase:
         """
         Create a :class:`requests.Response` object for the stub.
         """
+        return StubBase._create_raw_response(
+            status_code=status_code,
+            content=json.dumps(json_data).encode("utf-8"),
+            additional_headers=additional_headers,
+        )
+
+    @staticmethod
+    def _create_raw_response(
+        status_code: int,
+        content: bytes,
+        additional_headers: dict[str, str] | None = None,
+    ) -> Response:
+        """
+        Create a :class:`requests.Response` object for the stub from a body that has
+        already been serialised to JSON bytes.
+        """
         response = Response()
         response.status_code = status_code
         headers = {"Content-Type": "application/fhir+json"}
         if additional_headers is not None:
             headers.update(additional_headers)
         response.headers = CaseInsensitiveDict(headers)
-        response._content = json.dumps(json_data).encode("utf-8")  # noqa: SLF001 to customise stub
+        response._content = content  # noqa: SLF001 to customise stub
         response.encoding = "utf-8"
         # Set a reason phrase for HTTP error handling
         response.reason = http_responses.get(status_code, "Unknown")
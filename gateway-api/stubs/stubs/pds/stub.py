@@ -4,16 +4,66 @@ In-memory PDS FHIR R4 API stub.
 The stub does **not** implement the full PDS API surface, nor full FHIR validation.
 """
 
+import json
 import re
-import uuid
 from datetime import UTC, datetime
+from functools import cache
 from typing import Any
 
+from gateway_api.common.common import validate_nhs_number
 from requests import Response
 
 from stubs.base_stub import StubBase
 from stubs.data.patients import Patients
 
+# The stub does not care whether NHS numbers pass the modulus-11 check, so only their
+# shape is checked. Set this to apply the check digit validation as well.
+_VALIDATE_NHS_CHECK_DIGIT = False
+
+# X-Request-ID pattern from the PDS OpenAPI spec: a hyphenated 8-4-4-4-12 UUID.
+_UUID_RE = re.compile(
+    r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+)
+
+
+def _is_10_digits(value: str) -> bool:
+    """
+    Check the shape of an NHS number: exactly ten digits.
+
+    ``isdecimal`` accepts exactly the characters matched by the ``\\d`` regex class.
+    """
+    return len(value) == 10 and value.isdecimal()
+
+
+@cache
+def _operation_outcome_content(spine_code: str, display: str) -> bytes:
+    """
+    Serialise the OperationOutcome body for a Spine error code.
+
+    The stub only emits a handful of distinct errors, so each body is built and
+    encoded once.
+    """
+    body = {
+        "resourceType": "OperationOutcome",
+        "issue": [
+            {
+                "severity": "error",
+                "code": "value",
+                "details": {
+                    "coding": [
+                        {
+                            "system": "https://fhir.nhs.uk/R4/CodeSystem/Spine-ErrorOrWarningCode",
+                            "version": "1",
+                            "code": spine_code,
+                            "display": display,
+                        }
+                    ]
+                },
+            }
+        ],
+    }
+    return json.dumps(body).encode("utf-8")
+
 
 class PdsFhirApiStub(StubBase):
     """
@@ -40,8 +90,8 @@ class PdsFhirApiStub(StubBase):
         """
         self.strict_headers = strict_headers
 
-        # Internal store: nhs_number -> (patient_resource, version_id_int)
-        self._patients: dict[str, tuple[dict[str, Any], int]] = {}
+        # Internal store: nhs_number -> (serialised_patient_resource, etag)
+        self._patients: dict[str, tuple[bytes, str]] = {}
 
         # Seed a deterministic example matching the spec's id example.
         # Tests may overwrite this record via upsert_patient.
@@ -76,35 +126,40 @@ class PdsFhirApiStub(StubBase):
         Insert or replace a patient record in the stub store.
 
         :param nhs_number: NHS number as a 10-digit string.
-        :param patient: Patient resource dictionary. If ``None``, an empty Patient dict
-            is created and populated with required keys.
-        :param version_id: Version integer recorded into
-            ``patient["meta"]["versionId"]`` and used to generate the ETag on retrieval.
+        :param patient: Patient resource dictionary. It is copied rather than modified.
+            If ``None``, an empty Patient dict is created and populated with required
+            keys.
+        :param version_id: Version integer recorded into the stored
+            ``meta.versionId`` and used to generate the ETag on retrieval.
         :return: ``None``.
         :raises TypeError: If ``nhs_number`` is not a string.
         :raises ValueError: If ``nhs_number`` is not 10 digits or fails validation.
         """
-        try:
-            nhsnum_match = re.fullmatch(r"(\d{10})", nhs_number)
-        except TypeError as err:
-            raise TypeError("NHS Number must be a string") from err
+        if not isinstance(nhs_number, str):
+            raise TypeError("NHS Number must be a string")
 
-        if not nhsnum_match:
+        if not _is_10_digits(nhs_number):
             raise ValueError("NHS Number must be exactly 10 digits")
 
-        if not self._is_valid_nhs_number(nhs_number):
+        if _VALIDATE_NHS_CHECK_DIGIT and not validate_nhs_number(nhs_number):
             raise ValueError("NHS Number is not valid")
 
         if patient is None:
             patient = {}
 
-        patient.setdefault("resourceType", "Patient")
-        patient["id"] = nhs_number
-        patient.setdefault("meta", {})
-        patient["meta"]["versionId"] = str(version_id)
-        patient["meta"].setdefault("lastUpdated", self._now_fhir_instant())
+        # Build the stored resource as a new dict so the caller's patient (often a
+        # shared Patients constant) is never modified.
+        meta = {**patient.get("meta", {}), "versionId": str(version_id)}
+        if "lastUpdated" not in meta:
+            meta["lastUpdated"] = self._now_fhir_instant()
+        stored = {"resourceType": "Patient", **patient, "id": nhs_number, "meta": meta}
 
-        self._patients[nhs_number] = (patient, version_id)
+        # Records only change here, so serialise once rather than on every read.
+        # ETag mirrors the "W/\"<n>\"" shape and aligns to meta.versionId.
+        self._patients[nhs_number] = (
+            json.dumps(stored).encode("utf-8"),
+            f'W/"{version_id}"',
+        )
 
     def get_patient(
         self,
@@ -148,9 +203,9 @@ class PdsFhirApiStub(StubBase):
             headers_out["X-Correlation-Id"] = correlation_id
 
         # Path parameter validation: must be 10 digits and pass NHS-number validation.
-        if not re.fullmatch(
-            r"\d{10}", nhs_number or ""
-        ) or not self._is_valid_nhs_number(nhs_number):
+        if not _is_10_digits(nhs_number or "") or (
+            _VALIDATE_NHS_CHECK_DIGIT and not validate_nhs_number(nhs_number)
+        ):
             return self._operation_outcome(
                 status_code=400,
                 headers=headers_out,
@@ -159,7 +214,8 @@ class PdsFhirApiStub(StubBase):
             )
 
         # Lookup: not present => 404 OperationOutcome.
-        if nhs_number not in self._patients:
+        entry = self._patients.get(nhs_number)
+        if entry is None:
             return self._operation_outcome(
                 status_code=404,
                 headers=headers_out,
@@ -167,12 +223,11 @@ class PdsFhirApiStub(StubBase):
                 display="Patient not found",
             )
 
-        patient, version_id = self._patients[nhs_number]
+        content, etag = entry
 
-        # ETag mirrors the "W/\"<n>\"" shape and aligns to meta.versionId.
-        headers_out["ETag"] = f'W/"{version_id}"'
-        return self._create_response(
-            status_code=200, json_data=patient, additional_headers=headers_out
+        headers_out["ETag"] = etag
+        return self._create_raw_response(
+            status_code=200, content=content, additional_headers=headers_out
         )
 
     def get(
@@ -182,7 +237,7 @@ class PdsFhirApiStub(StubBase):
         params: dict[str, Any] | None = None,  # noqa: ARG002 # NOSONAR S1172 (ignored in stub)
         timeout: int | None = None,  # noqa: ARG002 # NOSONAR S1172 (ignored in stub)
     ) -> Response:
-        nhs_number = url.split("/")[-1]
+        nhs_number = url.rpartition("/")[2]
 
         request_id = headers.get("X-Request-ID") if headers else None
         correlation_id = headers.get("X-Correlation-ID") if headers else None
@@ -222,36 +277,17 @@ class PdsFhirApiStub(StubBase):
 
         :return: Timestamp string in the format ``YYYY-MM-DDTHH:MM:SSZ``.
         """
-        return (
-            datetime.now(UTC).replace(microsecond=0).isoformat().replace("+00:00", "Z")
-        )
+        return datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
 
     @staticmethod
     def _is_uuid(value: str) -> bool:
         """
-        Determine whether a string can be parsed as a UUID.
+        Determine whether a string is a UUID in the hyphenated form PDS requires.
 
         :param value: Candidate value.
-        :return: ``True`` if the value parses as a UUID, otherwise ``False``.
-        """
-        try:
-            uuid.UUID(value)
-            return True
-        except Exception:
-            return False
-
-    @staticmethod
-    def _is_valid_nhs_number(
-        nhs_number: str,  # NOQA: ARG004 We're just passing everything
-    ) -> bool:
-        """
-        Validate an NHS number. We don't actually care if NHS numbers are valid in the
-        stub for now, so just returns True.
-
-        If you do decide that you want to validate them in future, use the validator
-        in common.common.validate_nhs_number.
+        :return: ``True`` if the value is a hyphenated UUID, otherwise ``False``.
         """
-        return True
+        return _UUID_RE.fullmatch(value) is not None
 
     def _bad_request(
         self, message: str, *, request_id: str | None, correlation_id: str | None
@@ -294,25 +330,8 @@ class PdsFhirApiStub(StubBase):
         :param display: Human-readable display message.
         :return: A :class:`requests.Response` containing an OperationOutcome JSON body.
         """
-        body = {
-            "resourceType": "OperationOutcome",
-            "issue": [
-                {
-                    "severity": "error",
-                    "code": "value",
-                    "details": {
-                        "coding": [
-                            {
-                                "system": "https://fhir.nhs.uk/R4/CodeSystem/Spine-ErrorOrWarningCode",
-                                "version": "1",
-                                "code": spine_code,
-                                "display": display,
-                            }
-                        ]
-                    },
-                }
-            ],
-        }
-        return self._create_response(
-            status_code=status_code, json_data=body, additional_headers=dict(headers)
+        return self._create_raw_response(
+            status_code=status_code,
+            content=_operation_outcome_content(spine_code, display),
+            additional_headers=headers,
         )
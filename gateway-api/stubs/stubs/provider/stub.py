@@ -22,6 +22,7 @@ Request Body JSON (FHIR STU3 Parameters resource with patient NHS number.
 """
 
 import json
+from functools import cache
 from typing import Any
 
 from gateway_api.clinical_jwt import JWT, JWTValidator
@@ -34,6 +35,28 @@ from requests import Response
 from stubs.base_stub import PostStub, StubBase
 from stubs.data.bundles import Bundles
 
+# accessRecordStructured bodies keyed by NHS number. The bundles never change, so
+# they are serialised once here rather than on every request.
+_BUNDLE_CONTENT: dict[str, bytes] = {
+    "9999999999": json.dumps(Bundles.ALICE_JONES_9999999999).encode("utf-8"),
+    "9692140466": json.dumps(Bundles.INT_9692140466).encode("utf-8"),
+}
+
+
+@cache
+def _operation_outcome_content(code: str, diagnostics: str) -> bytes:
+    """
+    Serialise an OperationOutcome body for one of the stub's fixed error messages.
+
+    Only call this with constant messages; errors that echo request data should
+    build their body per call so the cache stays bounded.
+    """
+    body = {
+        "resourceType": "OperationOutcome",
+        "issue": [{"severity": "error", "code": code, "diagnostics": diagnostics}],
+    }
+    return json.dumps(body).encode("utf-8")
+
 
 class GpProviderStub(StubBase, PostStub):
     """
@@ -109,57 +132,33 @@ class GpProviderStub(StubBase, PostStub):
         # Validate Content-Type
         content_type = headers.get("Content-Type", "")
         if "application/fhir+json" not in content_type:
-            return self._create_response(
+            return self._create_raw_response(
                 status_code=400,
-                json_data={
-                    "resourceType": "OperationOutcome",
-                    "issue": [
-                        {
-                            "severity": "error",
-                            "code": "invalid",
-                            "diagnostics": "Content-Type must be application/fhir+json",
-                        }
-                    ],
-                },
+                content=_operation_outcome_content(
+                    "invalid", "Content-Type must be application/fhir+json"
+                ),
             )
 
         # Validate Ssp-InteractionID
         interaction_id = headers.get("Ssp-InteractionID", "")
         if interaction_id != ACCESS_RECORD_STRUCTURED_INTERACTION_ID:
-            return self._create_response(
+            return self._create_raw_response(
                 status_code=400,
-                json_data={
-                    "resourceType": "OperationOutcome",
-                    "issue": [
-                        {
-                            "severity": "error",
-                            "code": "invalid",
-                            "diagnostics": (
-                                f"Invalid Ssp-InteractionID: expected "
-                                f"{ACCESS_RECORD_STRUCTURED_INTERACTION_ID}"
-                            ),
-                        }
-                    ],
-                },
+                content=_operation_outcome_content(
+                    "invalid",
+                    "Invalid Ssp-InteractionID: expected "
+                    f"{ACCESS_RECORD_STRUCTURED_INTERACTION_ID}",
+                ),
             )
 
         # Validate Authorization header format and JWT
         auth_header = headers.get("Authorization", "")
         if not auth_header.startswith("Bearer "):
-            return self._create_response(
+            return self._create_raw_response(
                 status_code=400,
-                json_data={
-                    "resourceType": "OperationOutcome",
-                    "issue": [
-                        {
-                            "severity": "error",
-                            "code": "invalid",
-                            "diagnostics": (
-                                "Authorization header must start with 'Bearer '"
-                            ),
-                        }
-                    ],
-                },
+                content=_operation_outcome_content(
+                    "invalid", "Authorization header must start with 'Bearer '"
+                ),
             )
 
         # Extract and validate JWT
@@ -242,61 +241,29 @@ class GpProviderStub(StubBase, PostStub):
             return validation_error
 
         if trace_id == "invalid for test":
-            return self._create_response(
+            return self._create_raw_response(
                 status_code=400,
-                json_data={
-                    "resourceType": "OperationOutcome",
-                    "issue": [
-                        {
-                            "severity": "error",
-                            "code": "invalid",
-                            "diagnostics": "Invalid for testing",
-                        }
-                    ],
-                },
+                content=_operation_outcome_content("invalid", "Invalid for testing"),
             )
 
         try:
             nhs_number = json.loads(body)["parameter"][0]["valueIdentifier"]["value"]
         except (json.JSONDecodeError, KeyError, IndexError):
-            return self._create_response(
+            return self._create_raw_response(
                 status_code=400,
-                json_data={
-                    "resourceType": "OperationOutcome",
-                    "issue": [
-                        {
-                            "severity": "error",
-                            "code": "invalid",
-                            "diagnostics": "Malformed request body",
-                        }
-                    ],
-                },
-            )
-
-        if nhs_number == "9999999999":
-            return self._create_response(
-                status_code=200,
-                json_data=Bundles.ALICE_JONES_9999999999,
+                content=_operation_outcome_content("invalid", "Malformed request body"),
             )
 
-        if nhs_number == "9692140466":
-            return self._create_response(
-                status_code=200,
-                json_data=Bundles.INT_9692140466,
-            )
+        # The identifier value comes from the request body and may not be hashable.
+        content = (
+            _BUNDLE_CONTENT.get(nhs_number) if isinstance(nhs_number, str) else None
+        )
+        if content is not None:
+            return self._create_raw_response(status_code=200, content=content)
 
-        return self._create_response(
+        return self._create_raw_response(
             status_code=404,
-            json_data={
-                "resourceType": "OperationOutcome",
-                "issue": [
-                    {
-                        "severity": "error",
-                        "code": "not-found",
-                        "diagnostics": "Patient not found",
-                    }
-                ],
-            },
+            content=_operation_outcome_content("not-found", "Patient not found"),
         )
 
     def post(
@@ -677,5 +677,5 @@ class SdsFhirApiStub(StubBase, GetStub):
             ],
         }
         return self._create_response(
-            status_code=status_code, json_data=body, additional_headers=dict(headers)
+            status_code=status_code, json_data=body, additional_headers=headers
         )
@@ -10,11 +10,14 @@ and validate the returned :class:`requests.Response` objects against the
 contract requirements.
 """
 
+import copy
 import re
 import uuid
+from typing import Any
 
 import pytest
 import requests
+from stubs.data.patients import Patients
 from stubs.pds.stub import PdsFhirApiStub
 
 # ---------------------------------------------------------------------------
@@ -41,9 +44,14 @@ _VALID_CORRELATION_ID = str(uuid.uuid4()).upper()
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def stub() -> PdsFhirApiStub:
-    """Return a stub with strict header validation enabled (the default)."""
+    """
+    Return a stub with strict header validation enabled (the default).
+
+    The contract tests only read from the stub, so the seeded instance is shared
+    across the module rather than rebuilt for every test.
+    """
     instance = PdsFhirApiStub(strict_headers=True)
     assert (
         instance.get_patient(
@@ -57,7 +65,7 @@ def stub() -> PdsFhirApiStub:
     return instance
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def relaxed_stub() -> PdsFhirApiStub:
     """Return a stub with strict header validation disabled."""
     return PdsFhirApiStub(strict_headers=False)
@@ -284,12 +292,19 @@ class TestGetPatientInvalidRequestId:
     The PDS spec requires ``X-Request-ID`` to be a UUID (ideally version 4).
     """
 
+    @pytest.mark.parametrize(
+        "request_id",
+        [
+            pytest.param("not-a-uuid", id="not_a_uuid"),
+            pytest.param(uuid.uuid4().hex, id="unhyphenated"),
+            pytest.param(f"{{{uuid.uuid4()}}}", id="braced"),
+            pytest.param(uuid.uuid4().urn, id="urn"),
+        ],
+    )
     def test_status_code_is_400_when_request_id_not_uuid(
-        self, stub: PdsFhirApiStub
+        self, stub: PdsFhirApiStub, request_id: str
     ) -> None:
-        response = stub.get_patient(
-            nhs_number=_KNOWN_NHS_NUMBER, request_id="not-a-uuid"
-        )
+        response = stub.get_patient(nhs_number=_KNOWN_NHS_NUMBER, request_id=request_id)
         assert response.status_code == 400
 
     def test_no_request_id_format_validation_in_relaxed_mode(
@@ -406,3 +421,46 @@ class TestGetConvenienceMethod:
             },
         )
         assert response.headers.get("X-Correlation-Id") == _VALID_CORRELATION_ID
+
+
+# ---------------------------------------------------------------------------
+# upsert_patient() – stores a copy, leaves the caller's resource untouched
+# ---------------------------------------------------------------------------
+
+
+class TestUpsertPatient:
+    """Verify ``upsert_patient()`` does not modify the resource it is given."""
+
+    def test_upsert_does_not_modify_caller_patient(self) -> None:
+        stub = PdsFhirApiStub(strict_headers=False)
+        patient: dict[str, Any] = {"meta": {"versionId": "7"}}
+
+        stub.upsert_patient(_UNKNOWN_NHS_NUMBER, patient=patient, version_id=2)
+
+        assert patient == {"meta": {"versionId": "7"}}
+        stored = stub.get_patient(nhs_number=_UNKNOWN_NHS_NUMBER).json()
+        assert stored["id"] == _UNKNOWN_NHS_NUMBER
+        assert stored["meta"]["versionId"] == "2"
+
+    def test_seeding_does_not_modify_patient_fixtures(self) -> None:
+        original = copy.deepcopy(Patients.JANE_SMITH_9000000009)
+
+        stub = PdsFhirApiStub(strict_headers=False)
+        stub.upsert_patient(_KNOWN_NHS_NUMBER, Patients.JANE_SMITH_9000000009, 5)
+
+        assert original == Patients.JANE_SMITH_9000000009
+
+    @pytest.mark.parametrize(
+        ("nhs_number", "error"),
+        [
+            pytest.param(9000000009, TypeError, id="not_a_string"),
+            pytest.param(_INVALID_NHS_NUMBER, ValueError, id="not_10_digits"),
+        ],
+    )
+    def test_upsert_rejects_malformed_nhs_number(
+        self, nhs_number: Any, error: type[Exception]
+    ) -> None:
+        stub = PdsFhirApiStub(strict_headers=False)
+
+        with pytest.raises(error):
+            stub.upsert_patient(nhs_number)